@@ -1,7 +1,13 @@
 """Termis - iTerm2 automation package."""
 
-from .core.termis_app import TermisApp
 from .utils.constants import VERSION
 
 __version__ = VERSION
 __all__ = ['TermisApp', 'VERSION']
+
+def __getattr__(name):
+    # Import the app lazily so light entry points avoid loading iterm2 and yaml
+    if name == 'TermisApp':
+        from .core.termis_app import TermisApp
+        return TermisApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
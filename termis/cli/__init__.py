@@ -1,6 +1,12 @@
 """CLI modules for Termis."""
 
 from .parser import parse_arguments
-from .wizard import ConfigWizard
 
-__all__ = ['parse_arguments', 'ConfigWizard']
\ No newline at end of file
+__all__ = ['parse_arguments', 'ConfigWizard']
+
+def __getattr__(name):
+    # The wizard pulls in yaml, so only import it once it is asked for
+    if name == 'ConfigWizard':
+        from .wizard import ConfigWizard
+        return ConfigWizard
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,11 +4,11 @@ import argparse
 import textwrap
 from typing import Dict, Any
 
-def parse_arguments() -> Dict[str, Any]:
-    """Parse command-line arguments.
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
     
     Returns:
-        Dictionary of parsed arguments
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description='Workflow automation and layouts for iTerm',
@@ -48,4 +48,15 @@ def parse_arguments() -> Dict[str, Any]:
                        help='Check availability of development tools', 
                        action='store_true')
 
-    return vars(parser.parse_args())
\ No newline at end of file
+    return parser
+
+# Built once at import; parse_arguments only runs the parse itself
+_PARSER = _build_parser()
+
+def parse_arguments() -> Dict[str, Any]:
+    """Parse command-line arguments.
+    
+    Returns:
+        Dictionary of parsed arguments
+    """
+    return vars(_PARSER.parse_args())
\ No newline at end of file
@@ -1,9 +1,33 @@
 """Interactive configuration wizard module."""
 
+import sys
 import yaml
 from typing import Dict, Any, List, Tuple
 from ..utils.constants import BADGE_THEMES
 
+# Prefer the libyaml-backed emitter when PyYAML was built with it
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Theme names for the per-pane membership check
+_BADGE_THEMES = frozenset(BADGE_THEMES)
+
+_THEME_PROMPT = "Badge theme (default/success/error/warning/info/primary/secondary/dark/light) [default]: "
+_COMMAND_PROMPT = "> "
+
+def _ask(prompt: str, default: str = '') -> str:
+    """Prompt for a single line of input.
+    
+    Args:
+        prompt: Text written before reading the answer
+        default: Value returned for an empty answer or end of input
+        
+    Returns:
+        The answer without its trailing newline, or the default
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().rstrip("\n") or default
+
 class ConfigWizard:
     """Handles interactive configuration setup."""
     
@@ -23,24 +47,24 @@ class ConfigWizard:
         }
         
         # Get basic configuration
-        config['profile'] = input("Default iTerm profile to use [Default]: ") or 'Default'
+        config['profile'] = _ask("Default iTerm profile to use [Default]: ") or 'Default'
         
-        tab_count = int(input("Number of tabs to configure: "))
+        tab_count = int(_ask("Number of tabs to configure: "))
         
         for i in range(tab_count):
-            tab_id = input(f"Tab {i+1} ID: ")
+            tab_id = _ask(f"Tab {i+1} ID: ")
             tab_config = ConfigWizard._configure_tab(tab_id)
             config['tabs'][tab_id] = tab_config
         
         # Get save location
-        config_path = input("Save configuration to [termis.yml]: ") or "termis.yml"
+        config_path = _ask("Save configuration to [termis.yml]: ") or "termis.yml"
         
         # Clean configuration and convert types
         config = ConfigWizard._clean_config(config)
         
         # Write configuration to file
         with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=Dumper, default_flow_style=False, sort_keys=False)
         
         print(f"Configuration saved to {config_path}")
         return config_path, config
@@ -83,12 +107,12 @@ class ConfigWizard:
         """
         tab_config = {}
         
-        tab_config['title'] = input(f"Title for tab '{tab_id}' [optional]: ")
-        tab_config['root'] = input(f"Root directory for tab '{tab_id}' [optional]: ")
-        tab_config['reuse'] = input(f"Reuse existing tab with same title? (y/n) [n]: ").lower() == 'y'
+        tab_config['title'] = _ask(f"Title for tab '{tab_id}' [optional]: ")
+        tab_config['root'] = _ask(f"Root directory for tab '{tab_id}' [optional]: ")
+        tab_config['reuse'] = _ask(f"Reuse existing tab with same title? (y/n) [n]: ").lower() == 'y'
         
         # Configure panes
-        pane_count = int(input(f"Number of panes for tab '{tab_id}': "))
+        pane_count = int(_ask(f"Number of panes for tab '{tab_id}': "))
         tab_config['panes'] = ConfigWizard._configure_panes(pane_count)
         
         return tab_config
@@ -109,14 +133,14 @@ class ConfigWizard:
             pane = {}
             
             # Basic pane configuration
-            pane['position'] = input(f"Position for pane {j+1} (e.g., '1/1/1', '1/2/1'): ")
-            pane['title'] = input(f"Title for pane {j+1} [optional]: ")
+            pane['position'] = _ask(f"Position for pane {j+1} (e.g., '1/1/1', '1/2/1'): ")
+            pane['title'] = _ask(f"Title for pane {j+1} [optional]: ")
             
             # Badge configuration
-            badge = input(f"Badge for pane {j+1} [optional]: ")
+            badge = _ask(f"Badge for pane {j+1} [optional]: ")
             if badge:
-                theme = input(f"Badge theme (default/success/error/warning/info/primary/secondary/dark/light) [default]: ")
-                if theme and theme in BADGE_THEMES:
+                theme = _ask(_THEME_PROMPT)
+                if theme and theme in _BADGE_THEMES:
                     pane['badge'] = {
                         'text': badge,
                         'theme': theme
@@ -125,21 +149,21 @@ class ConfigWizard:
                     pane['badge'] = badge
             
             # Directory and profile configuration
-            pane['working_directory'] = input(f"Working directory for pane {j+1} [optional]: ")
-            pane['profile'] = input(f"Profile for pane {j+1} [optional, defaults to tab profile]: ")            
+            pane['working_directory'] = _ask(f"Working directory for pane {j+1} [optional]: ")
+            pane['profile'] = _ask(f"Profile for pane {j+1} [optional, defaults to tab profile]: ")            
             
             # Commands configuration
             commands = []
             print(f"Enter commands for pane {j+1} (empty line to finish):")
             while True:
-                cmd = input("> ")
+                cmd = _ask(_COMMAND_PROMPT)
                 if not cmd:
                     break
                 commands.append(cmd)
             
             if commands:
                 pane['commands'] = commands
-                delay_input = input(f"Enter delay for pane {j+1} in seconds [optional]: ")
+                delay_input = _ask(f"Enter delay for pane {j+1} in seconds [optional]: ")
                 if delay_input:
                     try:
                         pane['command_delay'] = int(delay_input)
@@ -164,38 +188,38 @@ class ConfigWizard:
         """
         tools = {}
         
-        add_tools = input("Configure tool integrations? (y/n) [n]: ").lower() == 'y'
+        add_tools = _ask("Configure tool integrations? (y/n) [n]: ").lower() == 'y'
         if not add_tools:
             return tools
             
         # VS Code configuration
-        if input("Configure VS Code integration? (y/n) [n]: ").lower() == 'y':
+        if _ask("Configure VS Code integration? (y/n) [n]: ").lower() == 'y':
             vscode = {}
-            vscode['files'] = input("Files to open (space-separated) [optional]: ").split()
-            vscode['new_window'] = input("Open in new window? (y/n) [n]: ").lower() == 'y'
+            vscode['files'] = _ask("Files to open (space-separated) [optional]: ").split()
+            vscode['new_window'] = _ask("Open in new window? (y/n) [n]: ").lower() == 'y'
             if vscode:
                 tools['vscode'] = vscode
         
         # Git configuration
-        if input("Configure Git integration? (y/n) [n]: ").lower() == 'y':
+        if _ask("Configure Git integration? (y/n) [n]: ").lower() == 'y':
             git = {}
-            git['clone'] = input("Repository to clone [optional]: ")
-            git['checkout'] = input("Branch to checkout [optional]: ")
-            git['pull'] = input("Pull updates? (y/n) [n]: ").lower() == 'y'
+            git['clone'] = _ask("Repository to clone [optional]: ")
+            git['checkout'] = _ask("Branch to checkout [optional]: ")
+            git['pull'] = _ask("Pull updates? (y/n) [n]: ").lower() == 'y'
             if git:
                 tools['git'] = git
         
         # Docker configuration
-        if input("Configure Docker integration? (y/n) [n]: ").lower() == 'y':
+        if _ask("Configure Docker integration? (y/n) [n]: ").lower() == 'y':
             docker = {}
-            if input("Configure docker-compose? (y/n) [n]: ").lower() == 'y':
-                docker['compose'] = input("docker-compose command (e.g., 'up -d'): ")
-                docker['compose_file'] = input("Path to docker-compose.yml [optional]: ")
-            if input("Configure docker run? (y/n) [n]: ").lower() == 'y':
+            if _ask("Configure docker-compose? (y/n) [n]: ").lower() == 'y':
+                docker['compose'] = _ask("docker-compose command (e.g., 'up -d'): ")
+                docker['compose_file'] = _ask("Path to docker-compose.yml [optional]: ")
+            if _ask("Configure docker run? (y/n) [n]: ").lower() == 'y':
                 run = {
-                    'image': input("Docker image: "),
-                    'detach': input("Run in detached mode? (y/n) [n]: ").lower() == 'y',
-                    'interactive': input("Run in interactive mode? (y/n) [n]: ").lower() == 'y'
+                    'image': _ask("Docker image: "),
+                    'detach': _ask("Run in detached mode? (y/n) [n]: ").lower() == 'y',
+                    'interactive': _ask("Run in interactive mode? (y/n) [n]: ").lower() == 'y'
                 }
                 docker['run'] = run
             if docker:
@@ -1,16 +1,219 @@
 """Configuration loader module."""
 
+import contextvars
+import copy
 import json
 import os
+import pprint
 import re
 import yaml
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..exceptions.termis_exceptions import ConfigurationError
 
 logger = logging.getLogger('termis.config')
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# REGEX for plain scalars containing ${word}, used by the implicit resolver
+_ENV_TAG_REGEX = re.compile(r'.*?\${(\w+)}.*?')
+# REGEX for each ${word} occurrence, used for substitution
+_ENV_SUB_REGEX = re.compile(r'\$\{(\w+)\}')
+
+# Suffix of the parsed-config cache written next to each config file
+CACHE_SUFFIX = '.cache.json'
+# Characters of a custom tag that are replaced in its cache file name
+_TAG_UNSAFE_RE = re.compile(r'[^\w-]')
+
+# Key fragments whose values are masked by ConfigLoader.sanitize_config
+_SENSITIVE = ('password', 'passwd', 'token', 'api_key', 'apikey', 'secret')
+_REDACTED = '***'
+
+# Placeholder for an !include that is still being parsed
+_INCLUDE_PENDING = object()
+
+# Parsed configs of this process keyed by (absolute path, tag)
+_CONFIG_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+# State of the load in progress: the config path !include resolves against,
+# the files and environment variables it read, and its parsed includes
+_current_load: contextvars.ContextVar = contextvars.ContextVar('termis_config_load')
+
+# Loader classes keyed by environment variable tag, registered on first use
+_LOADER_READY = False
+_TAG_LOADERS: Dict[str, type] = {}
+
+def _env_variables(loader, node):
+    """Process environment variables in configuration."""
+    env_refs = _current_load.get()['env']
+
+    def lookup(match):
+        name = match.group(1)
+        value = os.environ.get(name)
+        env_refs[name] = value
+        return name if value is None else value
+
+    return _ENV_SUB_REGEX.sub(lookup, loader.construct_scalar(node))
+
+def _name_marks(error: yaml.YAMLError, path: str) -> None:
+    """Point the marks of a parse error at the file instead of "<byte string>"."""
+    for attr in ('context_mark', 'problem_mark'):
+        mark = getattr(error, attr, None)
+        if mark is not None:
+            # libyaml's marks are read-only, so swap in equivalent pure-Python ones
+            setattr(error, attr, yaml.Mark(path, mark.index, mark.line, mark.column, None, None))
+
+def _include_constructor(loader, node):
+    """Process include directives in configuration."""
+    include_path = loader.construct_scalar(node)
+
+    # Handle relative paths
+    if not os.path.isabs(include_path):
+        base_dir = os.path.dirname(os.path.abspath(_current_load.get()['config_path']))
+        include_path = os.path.join(base_dir, include_path)
+
+    if not os.path.exists(include_path):
+        raise ConfigurationError(f"Included file does not exist: {include_path}")
+
+    # Each file is parsed once per load; the pending marker catches include cycles
+    key = os.path.realpath(include_path)
+    include_cache = _current_load.get()['includes']
+    if key in include_cache:
+        included = include_cache[key]
+        if included is _INCLUDE_PENDING:
+            raise ConfigurationError(f"Circular include detected: {include_path}")
+        # Panes are mutated in place later on, so every repeat gets its own copy
+        return copy.deepcopy(included)
+    include_cache[key] = _INCLUDE_PENDING
+
+    _current_load.get()['files'][os.path.abspath(include_path)] = _file_stamp(include_path)
+    # Hand libyaml the raw bytes instead of a text-mode file object
+    with open(include_path, 'rb') as f:
+        data = f.read()
+    try:
+        included = yaml.load(data, Loader=type(loader))
+    except yaml.YAMLError as e:
+        _name_marks(e, include_path)
+        raise ConfigurationError(f"Error parsing included file {include_path}: {e}")
+    include_cache[key] = included
+    return included
+
+class _TermisLoader(Loader):
+    """Safe loader for termis configs; its tags are registered by _get_loader."""
+    pass
+
+def _get_loader(tag: str) -> type:
+    """Return the loader class for a tag, registering the termis tags on first use."""
+    global _LOADER_READY
+    if not _LOADER_READY:
+        _TermisLoader.add_implicit_resolver('!ENV', _ENV_TAG_REGEX, None)
+        _TermisLoader.add_constructor('!ENV', _env_variables)
+        _TermisLoader.add_constructor('!include', _include_constructor)
+        _TAG_LOADERS['!ENV'] = _TermisLoader
+        _LOADER_READY = True
+
+    loader = _TAG_LOADERS.get(tag)
+    if loader is None:
+        # Custom tags go on a subclass so they never leak into the default loader
+        loader = type("TermisLoader", (_TermisLoader,), {})
+        loader.add_implicit_resolver(tag, _ENV_TAG_REGEX, None)
+        loader.add_constructor(tag, _env_variables)
+        _TAG_LOADERS[tag] = loader
+    return loader
+
+def _file_stamp(path: str) -> List[int]:
+    """Return the modification time and size used to detect file changes."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def _cache_path(abs_path: str, tag: str) -> str:
+    """Return the sidecar cache path for a config parsed with the given tag."""
+    if tag == '!ENV':
+        return abs_path + CACHE_SUFFIX
+    return f"{abs_path}.{_TAG_UNSAFE_RE.sub('_', tag)}{CACHE_SUFFIX}"
+
+def _is_fresh(entry: Any, tag: str) -> bool:
+    """Check a cache entry against the files and environment it was built from."""
+    if not isinstance(entry, dict) or entry.get('tag') != tag or 'config' not in entry:
+        return False
+    try:
+        for path, stamp in entry['files'].items():
+            if _file_stamp(path) != stamp:
+                return False
+        return all(os.environ.get(name) == value for name, value in entry['env'].items())
+    except (OSError, KeyError, AttributeError):
+        return False
+
+def _load_cached(abs_path: str, tag: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a previously parsed config if none of its inputs changed."""
+    entry = _CONFIG_CACHE.get((abs_path, tag))
+    if entry is None or not _is_fresh(entry, tag):
+        cache_path = _cache_path(abs_path, tag)
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if isinstance(entry, dict) and entry.get('env'):
+            # Written before env-dependent configs stopped being persisted; it
+            # holds resolved values, so get rid of it rather than trust it
+            _remove_cache_file(cache_path)
+            return None
+        if not _is_fresh(entry, tag):
+            return None
+        _CONFIG_CACHE[(abs_path, tag)] = entry
+    return copy.deepcopy(entry['config'])
+
+def _remove_cache_file(cache_path: str) -> None:
+    """Delete a sidecar cache file if it exists."""
+    try:
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Could not remove config cache %s: %s", cache_path, e)
+
+def _store_cached(abs_path: str, entry: Dict[str, Any], persist: bool = True) -> None:
+    """Remember a parsed config in memory and, when it is safe to, on disk.
+    
+    Configs that substituted environment variables stay in memory only, since
+    the sidecar would otherwise hold the resolved values (often secrets) in
+    plain text next to the config.
+    """
+    cache_path = _cache_path(abs_path, entry['tag'])
+    if entry['env']:
+        _CONFIG_CACHE[(abs_path, entry['tag'])] = copy.deepcopy(entry)
+        # Don't leave an older sidecar around for a config that now uses env vars
+        _remove_cache_file(cache_path)
+        return
+
+    try:
+        data = json.dumps(entry)
+        stored = json.loads(data)
+    except (TypeError, ValueError):
+        stored = None
+
+    # JSON turns non-string keys into strings, so only persist exact round-trips
+    if stored is None or stored['config'] != entry['config']:
+        _CONFIG_CACHE[(abs_path, entry['tag'])] = copy.deepcopy(entry)
+        return
+
+    _CONFIG_CACHE[(abs_path, entry['tag'])] = stored
+    if not persist:
+        return
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        # Readable by the owner only; the config itself may hold credentials
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
 class ConfigLoader:
     """Handles config loading with support for includes and environment variables."""
     
@@ -32,53 +235,44 @@ class ConfigLoader:
         if not os.path.isfile(config_path):
             raise ConfigurationError(f"Config file does not exist at {config_path}")
 
-        # REGEX for ${word}
-        tag_regex = re.compile(r'.*?\${(\w+)}.*?')
-        loader = yaml.FullLoader
-        loader.add_implicit_resolver(tag, tag_regex, None)
-        
-        def env_variables(loader, node):
-            """Process environment variables in configuration."""
-            scalar = loader.construct_scalar(node)
-            match = tag_regex.findall(scalar)
-            if match:
-                value = scalar
-                for g in match:
-                    value = value.replace(f'${{{g}}}', os.environ.get(g, g))
-                return value
-            return scalar
+        abs_path = os.path.abspath(config_path)
+        config = _load_cached(abs_path, tag)
         
-        def include_constructor(loader, node):
-            """Process include directives in configuration."""
-            include_path = loader.construct_scalar(node)
+        if config is None:
+            state = {
+                'config_path': config_path,
+                'files': {abs_path: _file_stamp(abs_path)},
+                'env': {},
+                'includes': {os.path.realpath(abs_path): _INCLUDE_PENDING},
+            }
+            token = _current_load.set(state)
+            try:
+                # Hand libyaml the raw bytes instead of a text-mode file object
+                with open(config_path, 'rb') as file:
+                    data = file.read()
+                config = yaml.load(data, Loader=_get_loader(tag))
+            except yaml.YAMLError as e:
+                _name_marks(e, config_path)
+                logger.error(f"Error parsing YAML config {config_path}: {e}")
+                raise ConfigurationError(f"Error parsing YAML config {config_path}: {e}")
+            finally:
+                _current_load.reset(token)
             
-            # Handle relative paths
-            if not os.path.isabs(include_path):
-                base_dir = os.path.dirname(os.path.abspath(config_path))
-                include_path = os.path.join(base_dir, include_path)
-                
-            if not os.path.exists(include_path):
-                raise ConfigurationError(f"Included file does not exist: {include_path}")
-                
-            with open(include_path, 'r') as f:
-                return yaml.load(f, Loader=loader)
+            # Dry runs leave no files behind
+            _store_cached(abs_path, {
+                'tag': tag,
+                'files': state['files'],
+                'env': state['env'],
+                'config': config,
+            }, persist=not dry_run)
         
-        # Add constructors
-        loader.add_constructor(tag, env_variables)
-        loader.add_constructor('!include', include_constructor)
+        # Sanitizing and serializing the whole config is only worth it if it gets logged
+        if dry_run and logger.isEnabledFor(logging.INFO):
+            logger.info("Dry run: Loaded config from %s", config_path)
+            logger.info("Config structure: %s",
+                        pprint.pformat(ConfigLoader.sanitize_config(config), compact=True, width=120))
         
-        try:
-            with open(config_path) as file:
-                config = yaml.load(file, Loader=loader)
-                
-                if dry_run:
-                    logger.info(f"Dry run: Loaded config from {config_path}")
-                    logger.info(f"Config structure: {json.dumps(ConfigLoader.sanitize_config(config), indent=2)}")
-                
-                return config
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML config: {e}")
-            raise ConfigurationError(f"Error parsing YAML config: {e}")
+        return config
     
     @staticmethod
     def load_profile(profile_name: str, profiles_dir: str) -> Dict[str, Any]:
@@ -106,9 +300,31 @@ class ConfigLoader:
     @staticmethod
     def sanitize_config(config: Dict[str, Any]) -> Dict[str, Any]:
         """Remove sensitive data from config for logging purposes."""
-        if isinstance(config, dict):
-            return {k: ConfigLoader.sanitize_config(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [ConfigLoader.sanitize_config(i) for i in config]
-        else:
-            return config
\ No newline at end of file
+        if not isinstance(config, (dict, list)):
+            return config
+        
+        # Walk the tree with an explicit stack, filling each copy as it is popped.
+        # Copies are memoized by source id so aliased or self-referencing nodes
+        # are only copied once, as in copy.deepcopy
+        sanitized = {} if isinstance(config, dict) else []
+        memo = {id(config): sanitized}
+        stack = [(config, sanitized)]
+        while stack:
+            source, target = stack.pop()
+            items = source.items() if isinstance(source, dict) else enumerate(source)
+            for key, value in items:
+                if isinstance(key, str) and any(s in key.lower() for s in _SENSITIVE):
+                    value = _REDACTED
+                elif isinstance(value, (dict, list)):
+                    child = memo.get(id(value))
+                    if child is None:
+                        child = memo[id(value)] = {} if isinstance(value, dict) else []
+                        stack.append((value, child))
+                    value = child
+                
+                if isinstance(target, dict):
+                    target[key] = value
+                else:
+                    target.append(value)
+        
+        return sanitized
\ No newline at end of file
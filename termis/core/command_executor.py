@@ -2,18 +2,20 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-import iterm2
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from ..integrations.tools_coordinator import ToolsCoordinator
 
+if TYPE_CHECKING:
+    import iterm2
+
 logger = logging.getLogger('termis.executor')
 
 class CommandExecutor:
     """Handles command execution in iTerm2 sessions."""
     
     @staticmethod
-    async def execute_commands(session: iterm2.Session, 
+    async def execute_commands(session: 'iterm2.Session', 
                              commands: List[str], 
                              delay: int = 0, 
                              working_dir: Optional[str] = None,
@@ -28,32 +30,65 @@ class CommandExecutor:
             pane_config: Additional pane configuration for tool integrations
         """
         try:
-            commands_to_run = commands.copy()  # Create a copy to avoid modifying the original
-
-            # Change to working directory if specified
-            if working_dir:
-                await session.async_send_text(f"cd {working_dir}\n")
+            # Never mutated in place, so the caller's list is only copied when tools prepend to it
+            commands_to_run = commands
             
             # Process tool integrations if configured
             if pane_config and pane_config.get('tools'):
-                tool_commands = ToolsCoordinator.process_tool_hooks(pane_config, working_dir)
-                # Only prepend tool commands if they exist and aren't empty
-                logger.info(f"COM: {tool_commands}")
-                if tool_commands and len(tool_commands) > 0:
-                    commands_to_run = tool_commands + commands_to_run
+                # Tool commands are generated without a trailing newline, unlike
+                # the pane commands which were already formatted for sending
+                tool_commands = [
+                    f"{command}\n"
+                    for command in ToolsCoordinator.iter_tool_commands(pane_config, working_dir)
+                ]
+                logger.debug("COM: %s", tool_commands)
+                # Only prepend tool commands if there are any
+                if tool_commands:
+                    commands_to_run = tool_commands + commands
+
+            # Change to working directory if specified
+            cd_command = f"cd {working_dir}\n" if working_dir else ""
+
+            # Without a delay there is nothing to wait for, so send everything in one write
+            if delay <= 0:
+                payload = cd_command + "".join(commands_to_run)
+                if payload:
+                    await session.async_send_text(payload)
+                return
 
-            # Execute each command with optional delay
+            if cd_command:
+                await session.async_send_text(cd_command)
+
+            # Execute each command with the configured delay
             for command in commands_to_run:
-                if delay > 0:
-                    await asyncio.sleep(delay)
-                await session.async_send_text(f"{command}")
+                await asyncio.sleep(delay)
+                await session.async_send_text(command)
                 
         except Exception as e:
             logger.error(f"Error executing commands: {e}")
             raise
     
     @staticmethod
-    async def format_commands(commands: List[str], prompt: Optional[str] = None) -> List[str]:
+    async def execute_many(jobs: List[Tuple['iterm2.Session', List[str], int,
+                                            Optional[str], Optional[Dict[str, Any]]]]) -> List[Any]:
+        """Execute command streams for several sessions concurrently.
+        
+        Commands within a session still run in order; only the round-trips of
+        different sessions overlap.
+        
+        Args:
+            jobs: Tuples of execute_commands arguments, one per session
+            
+        Returns:
+            Results in job order, with any raised exception in place of its result
+        """
+        return await asyncio.gather(
+            *(CommandExecutor.execute_commands(*job) for job in jobs),
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def format_commands(commands: List[str], prompt: Optional[str] = None) -> List[str]:
         """Format commands for execution.
         
         Args:
@@ -70,4 +105,19 @@ class CommandExecutor:
         if prompt:
             formatted.append(prompt)
             
-        return formatted
\ No newline at end of file
+        return formatted
+    
+    @staticmethod
+    def format_commands_joined(commands: List[str], prompt: Optional[str] = None) -> str:
+        """Format commands for execution as a single string.
+        
+        Args:
+            commands: List of commands to format
+            prompt: Optional prompt to add after commands
+            
+        Returns:
+            Newline-terminated commands followed by the prompt
+        """
+        if not commands:
+            return prompt or ""
+        return "\n".join(commands) + "\n" + (prompt or "")
\ No newline at end of file
@@ -1,33 +1,87 @@
 """iTerm2 manager module."""
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-import iterm2
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from ..exceptions.termis_exceptions import TermisException
+from ..utils.constants import BADGE_THEMES
 from .command_executor import CommandExecutor
 
+if TYPE_CHECKING:
+    import iterm2
+
 logger = logging.getLogger('termis.iterm')
 
-# Define badge theme colors
-BADGE_THEMES = {
-    'default': {'fg': (213, 194, 194), 'bg': None},
-    'success': {'fg': (76, 175, 80), 'bg': None},
-    'error': {'fg': (244, 67, 54), 'bg': None},
-    'warning': {'fg': (255, 193, 7), 'bg': None},
-    'info': {'fg': (33, 150, 243), 'bg': None},
-    'primary': {'fg': (156, 39, 176), 'bg': None},
-    'secondary': {'fg': (96, 125, 139), 'bg': None},
-    'dark': {'fg': (33, 33, 33), 'bg': None},
-    'light': {'fg': (227, 227, 227), 'bg': None},
-}
+@lru_cache(maxsize=None)
+def _theme_colors() -> Dict[str, Tuple[Optional['iterm2.color.Color'], Optional['iterm2.color.Color']]]:
+    """Badge colors per theme as (foreground, background), built on first use."""
+    import iterm2
+    return {
+        name: tuple(iterm2.color.Color(*rgb) if rgb else None for rgb in (theme['fg'], theme['bg']))
+        for name, theme in BADGE_THEMES.items()
+    }
+
+@lru_cache(maxsize=256)
+def _parse_position(position: str) -> Tuple[int, int, int]:
+    """Parse a position string; cached since the same positions recur across tabs."""
+    column, sep, rest = position.partition('/')
+    if not sep:
+        # Just column specified, default row and column-in-row to 1
+        return int(column), 1, 1
+    
+    row, sep, column_in_row = rest.partition('/')
+    if not sep:
+        # Column and row specified, default column-in-row to 1
+        return int(column), int(row), 1
+    
+    if '/' in column_in_row:
+        raise TermisException(f"Invalid position format: {position}")
+    # All three components specified
+    return int(column), int(row), int(column_in_row)
 
 class ITermManager:
     """Manages iTerm2 windows, tabs, and sessions."""
     
+    # Background RPCs nothing downstream depends on; awaited by flush_pending
+    _pending: List[asyncio.Task] = []
+    
+    # Profiles fetched so far, keyed by (id(connection), profile name)
+    _profile_cache: Dict[Tuple[int, str], 'iterm2.Profile'] = {}
+    
+    @staticmethod
+    def defer(coro) -> None:
+        """Schedule an RPC in the background instead of awaiting it in place."""
+        ITermManager._pending.append(asyncio.create_task(coro))
+    
+    @staticmethod
+    async def flush_pending() -> None:
+        """Wait for all deferred RPCs and log the ones that failed."""
+        pending, ITermManager._pending = ITermManager._pending, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in background iTerm2 call: {result}")
+    
+    @staticmethod
+    async def _get_profile(connection: 'iterm2.Connection', profile_name: str) -> Optional['iterm2.Profile']:
+        """Fetch a profile by name, reusing earlier lookups on the same connection."""
+        key = (id(connection), profile_name)
+        if key not in ITermManager._profile_cache:
+            import iterm2
+            ITermManager._profile_cache[key] = await iterm2.Profile.async_get(connection, profile_name)
+        return ITermManager._profile_cache[key]
+    
+    @staticmethod
+    def clear_profile_cache() -> None:
+        """Forget fetched profiles so the next run sees any changes made in iTerm2."""
+        ITermManager._profile_cache.clear()
+    
     @staticmethod
-    async def get_current_window(app: iterm2.App, connection: iterm2.Connection, 
-                               new: bool, profile_name: str) -> iterm2.Window:
+    async def get_current_window(app: 'iterm2.App', connection: 'iterm2.Connection', 
+                               new: bool, profile_name: str) -> 'iterm2.Window':
         """Get the current window or create a new one.
         
         Args:
@@ -43,9 +97,10 @@ class ITermManager:
             curr_win = app.current_window
             
             if not curr_win or new:
+                import iterm2
                 curr_win = await iterm2.Window.async_create(connection, profile=profile_name)
             
-            await curr_win.async_activate()
+            ITermManager.defer(curr_win.async_activate())
             return curr_win
             
         except Exception as e:
@@ -53,20 +108,28 @@ class ITermManager:
             raise TermisException(f"Failed to get current window: {e}")
 
     @staticmethod
-    async def find_tab_by_title(window: iterm2.Window, title: str) -> Optional[iterm2.Tab]:
+    async def find_tab_by_title(window: 'iterm2.Window', title: str) -> Optional['iterm2.Tab']:
         """Find a tab by its title in the given window."""
-        for tab in window.tabs:
-            tab_title = await tab.async_get_title()
-            if tab_title == title:
-                return tab
-        return None
+        async def fetch(tab: 'iterm2.Tab') -> Tuple['iterm2.Tab', str]:
+            return tab, await tab.async_get_title()
+        
+        # Ask every tab at once and stop at the first answer that matches
+        tasks = [asyncio.create_task(fetch(tab)) for tab in window.tabs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                tab, tab_title = await next_done
+                if tab_title == title:
+                    return tab
+            return None
+        finally:
+            # Drop the title requests still in flight
+            for task in tasks:
+                task.cancel()
 
     @staticmethod
-    async def add_badge(session: iterm2.Session, badge_config: Dict[str, Any]) -> None:
+    async def add_badge(session: 'iterm2.Session', badge_config: Dict[str, Any]) -> None:
         """Apply badge to a session with theme support."""
         try:
-            profile = await session.async_get_profile()
-            
             # Handle different badge configurations
             if isinstance(badge_config, str):
                 badge_text = badge_config
@@ -77,22 +140,50 @@ class ITermManager:
             else:
                 return
             
-            # Apply the badge text
-            await profile.async_set_badge_text(badge_text)
+            # Collect the changes locally and send them in a single update
+            import iterm2
+            changes = iterm2.LocalWriteOnlyProfile()
+            changes.set_badge_text(badge_text)
             
             # Apply theme if it exists
-            if theme in BADGE_THEMES:
-                fg_color = BADGE_THEMES[theme]['fg']
+            colors = _theme_colors().get(theme)
+            if colors:
+                fg_color, bg_color = colors
                 if fg_color:
-                    await profile.async_set_badge_color(iterm2.color.Color(*fg_color))
+                    changes.set_badge_color(fg_color)
                     
-                bg_color = BADGE_THEMES[theme]['bg']
                 if bg_color:
-                    await profile.async_set_badge_background_color(iterm2.color.Color(*bg_color))
+                    changes.set_badge_background_color(bg_color)
+            
+            await session.async_set_profile_properties(changes)
                     
         except Exception as e:
             logger.error(f"Error adding badge: {e}")
 
+    @staticmethod
+    async def _configure_session(session: 'iterm2.Session', pane: Dict[str, Any]) -> None:
+        """Apply a pane's title, color preset and badge to its session.
+        
+        The RPCs are independent of each other, so they are sent concurrently.
+        
+        Args:
+            session: iTerm2 session of the pane
+            pane: Pane configuration
+        """
+        title = pane.get('title')
+        color = pane.get('color')
+        badge = pane.get('badge')
+        
+        coros = []
+        if title:
+            coros.append(session.async_set_name(title))
+        if color:
+            coros.append(session.async_set_color_preset(color))
+        if badge:
+            coros.append(ITermManager.add_badge(session, badge))
+        if coros:
+            await asyncio.gather(*coros)
+
     @staticmethod
     def parse_position(position: str) -> Tuple[int, int, int]:
         """Parse a position string into column, row, and column-in-row components.
@@ -106,23 +197,11 @@ class ITermManager:
         Raises:
             TermisException: If position format is invalid
         """
-        parts = position.split('/')
-        
-        if len(parts) == 1:
-            # Just column specified, default row and column-in-row to 1
-            return int(parts[0]), 1, 1
-        elif len(parts) == 2:
-            # Column and row specified, default column-in-row to 1
-            return int(parts[0]), int(parts[1]), 1
-        elif len(parts) == 3:
-            # All three components specified
-            return int(parts[0]), int(parts[1]), int(parts[2])
-        else:
-            raise TermisException(f"Invalid position format: {position}")
+        return _parse_position(position)
 
     @staticmethod
-    async def create_tab_with_config(window: iterm2.Window, tab_config: Dict[str, Any], 
-                                   tab_id: str, profile_name: str, dry_run: bool = False) -> Optional[iterm2.Tab]:
+    async def create_tab_with_config(window: 'iterm2.Window', tab_config: Dict[str, Any], 
+                                   tab_id: str, profile_name: str, dry_run: bool = False) -> Optional['iterm2.Tab']:
         """Create and configure a tab based on its configuration."""
         try:
             # Check if we should reuse an existing tab with the same title
@@ -146,7 +225,7 @@ class ITermManager:
             
             # Set tab title if provided
             if tab_title:
-                await new_tab.async_set_title(tab_title)
+                ITermManager.defer(new_tab.async_set_title(tab_title))
                 
             return new_tab
             
@@ -155,242 +234,149 @@ class ITermManager:
             raise TermisException(f"Failed to create tab: {e}")
 
     @staticmethod
-    async def render_tab_panes(tab: iterm2.Tab, panes: List[Dict[str, Any]], 
-                             profile_name: str, dry_run: bool = False) -> Dict[str, iterm2.Session]:
-        """Render panes within a tab with dependencies between panes"""
-        if dry_run:
-            logger.info(f"Dry run: Would render {len(panes)} panes in tab '{await tab.async_get_title()}'")
-            return {}
+    def _parse_pane_positions(panes: List[Dict[str, Any]]) -> List[Tuple[Tuple[int, int, int], Dict[str, Any]]]:
+        """Parse the position of every pane, logging and skipping invalid ones.
         
-        # Parse all positions and organize panes by position
-        column_map = {}  # Structure: {column_num: {row_num: {col_in_row_num: pane}}}
+        The normalized "column/row/column-in-row" form is stored back in each pane.
         
+        Args:
+            panes: Pane configurations of a tab
+            
+        Returns:
+            List of (position, pane) pairs in configuration order
+        """
+        parsed = []
         for pane in panes:
             position = pane.get("position", "1/1/1")
             try:
-                column, row, column_in_row = ITermManager.parse_position(position)
-                
-                # Initialize nested dictionaries if needed
-                if column not in column_map:
-                    column_map[column] = {}
-                if row not in column_map[column]:
-                    column_map[column][row] = {}
-                    
-                column_map[column][row][column_in_row] = pane
-                # Store the parsed position back in the pane config
-                pane["position"] = f"{column}/{row}/{column_in_row}"
+                pos = ITermManager.parse_position(position)
             except Exception as e:
                 logger.error(f"Invalid position format '{position}': {e}")
                 continue
+            pane["position"] = "{}/{}/{}".format(*pos)
+            parsed.append((pos, pane))
+        return parsed
+
+    @staticmethod
+    async def render_tab_panes(tab: 'iterm2.Tab', panes: List[Dict[str, Any]], 
+                             profile_name: str, dry_run: bool = False,
+                             tab_title: Optional[str] = None) -> Dict[str, 'iterm2.Session']:
+        """Render panes within a tab with dependencies between panes"""
+        if dry_run:
+            logger.info(f"Dry run: Would render {len(panes)} panes in tab '{tab_title or '<current>'}'")
+            return {}
+        
+        # Organize panes by (column, row, column-in-row)
+        panes_by_pos: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+        focus_position = None
+        
+        for pos, pane in ITermManager._parse_pane_positions(panes):
+            panes_by_pos[pos] = pane
+            # The last pane asking for focus wins
+            if pane.get('focus'):
+                focus_position = pos
+        
+        positions = sorted(panes_by_pos)
+        
+        # Work out which pane each pane is split from in one pass over the sorted
+        # positions. Main columns split vertically from the previous column, rows
+        # horizontally from the previous row of their column and columns within a
+        # row vertically from their left neighbour. A parent splits its columns,
+        # then its rows, then its columns within the row, so children are kept in
+        # one bucket per kind to give the order needed for the layout.
+        children: Dict[Tuple[int, int, int], Tuple[List[Tuple[Tuple[int, int, int], bool]], ...]] = {}
+        last_column = (1, 1, 1)
+        last_row = None
+        previous = None
+        
+        for pos in positions:
+            column, row, column_in_row = pos
+            if column_in_row > 1:
+                parent = previous if previous and previous[:2] == pos[:2] else (column, row, 1)
+                kind, vertical = 2, True
+            elif row > 1:
+                parent = last_row if last_row and last_row[0] == column else (column, 1, 1)
+                kind, vertical = 1, False
+                last_row = pos
+            elif column > 1:
+                parent = last_column
+                kind, vertical = 0, True
+                last_column = pos
+            else:
+                previous = pos
+                continue
+            children.setdefault(parent, ([], [], []))[kind].append((pos, vertical))
+            previous = pos
         
         # Track sessions by their position
         sessions = {}
         
         # First, get the initial session in the tab
         current_session = tab.current_session
-        sessions["1/1/1"] = current_session
-        
-        # Keep track of which session should receive focus at the end
-        focus_session = current_session
-        
-        # Process all main columns first (1/1/1, 2/1/1, 3/1/1, etc.)
-        columns = sorted(column_map.keys())
+        sessions[(1, 1, 1)] = current_session
         
         # Apply settings to the first column/pane (which already exists)
-        if 1 in columns and 1 in column_map[1] and 1 in column_map[1][1]:
-            first_pane = column_map[1][1][1]
-            
+        first_pane = panes_by_pos.get((1, 1, 1))
+        if first_pane:
             # Apply profile if specified
             pane_profile = first_pane.get('profile', profile_name)
             if pane_profile != profile_name:
-                profile = await iterm2.Profile.async_get(current_session.connection, pane_profile)
+                profile = await ITermManager._get_profile(current_session.connection, pane_profile)
                 if profile:
                     await current_session.async_set_profile(profile)
             
             # Apply other settings
-            if first_pane.get('title'):
-                await current_session.async_set_name(first_pane.get('title'))
-            
-            if first_pane.get('color'):
-                await current_session.async_set_color_preset(first_pane.get('color'))
-            
-            if first_pane.get('badge'):
-                await ITermManager.add_badge(current_session, first_pane.get('badge'))
-            
-            if first_pane.get('focus'):
-                focus_session = current_session
-            
-            # Execute commands
-            commands = first_pane.get('commands', [])
-            delay = first_pane.get('command_delay', 0)
-            working_dir = first_pane.get('working_directory')
-            
-            if not working_dir and first_pane.get('root'):
-                working_dir = first_pane.get('root')
-            
-            await CommandExecutor.execute_commands(current_session, commands, delay, working_dir, first_pane)
+            await ITermManager._configure_session(current_session, first_pane)
         
-        # Create subsequent main columns (vertical splits) sequentially
-        previous_column = 1
-        for column in [c for c in columns if c > 1]:
-            if 1 not in column_map[column] or 1 not in column_map[column][1]:
-                continue
-            
-            pane = column_map[column][1][1]
-            pane_profile = pane.get('profile', profile_name)
-            
-            # Create vertical split from the previous column
-            previous_position = f"{previous_column}/1/1"
-            parent_session = sessions[previous_position]
-            new_session = await parent_session.async_split_pane(vertical=True, profile=pane_profile)
-            position = f"{column}/1/1"
-            sessions[position] = new_session
-            
-            # Update previous column for the next iteration
-            previous_column = column
-            
-            # Apply settings
-            if pane.get('title'):
-                await new_session.async_set_name(pane.get('title'))
-            
-            if pane.get('color'):
-                await new_session.async_set_color_preset(pane.get('color'))
-            
-            if pane.get('badge'):
-                await ITermManager.add_badge(new_session, pane.get('badge'))
-            
-            if pane.get('focus'):
-                focus_session = new_session
-            
-            # Execute commands
-            commands = pane.get('commands', [])
-            delay = pane.get('command_delay', 0)
-            working_dir = pane.get('working_directory')
-            
-            if not working_dir and pane.get('root'):
-                working_dir = pane.get('root')
-            
-            await CommandExecutor.execute_commands(new_session, commands, delay, working_dir, pane)
+        async def build(pos: Tuple[int, int, int]) -> None:
+            """Split the children of a pane in order, starting each child's settings
+            and subtree as soon as it exists.
+            
+            When a split fails the splits still pending are cancelled, while panes
+            that already exist still get their title, color and badge.
+            """
+            configures = []
+            subtrees = []
+            try:
+                for child_pos, vertical in chain.from_iterable(children.get(pos, ())):
+                    pane = panes_by_pos[child_pos]
+                    # Always name the profile: without it iTerm2 splits with its default
+                    # profile rather than the parent's, and the name is resolved app-side
+                    new_session = await sessions[pos].async_split_pane(
+                        vertical=vertical, profile=pane.get('profile', profile_name)
+                    )
+                    sessions[child_pos] = new_session
+                    configures.append(asyncio.create_task(ITermManager._configure_session(new_session, pane)))
+                    subtrees.append(asyncio.create_task(build(child_pos)))
+                await asyncio.gather(*subtrees)
+            except BaseException:
+                for task in subtrees:
+                    task.cancel()
+                await asyncio.gather(*subtrees, *configures, return_exceptions=True)
+                raise
+            await asyncio.gather(*configures)
         
-        # Now process rows within each column
-        for column in columns:
-            rows = sorted([r for r in column_map.get(column, {}).keys() if r > 1])
-            
-            if not rows:
-                continue
-                
-            # Get the first row's parent (column's main pane)
-            parent_position = f"{column}/1/1"
-            parent_session = sessions.get(parent_position)
-            
-            if not parent_session:
-                logger.warning(f"Parent session not found for {parent_position}")
+        await build((1, 1, 1))
+        
+        for parent_pos in children:
+            if parent_pos not in sessions:
+                logger.warning("Parent session not found for {}/{}/{}".format(*parent_pos))
+        
+        # With the layout in place, run every pane's commands concurrently
+        jobs = []
+        for pos in positions:
+            session = sessions.get(pos)
+            if not session:
                 continue
-                
-            # Create rows sequentially within this column
-            previous_row = 1
-            for row in rows:
-                if 1 not in column_map[column][row]:
-                    continue
-                
-                # Get the first pane in this row
-                pane = column_map[column][row][1]
-                pane_profile = pane.get('profile', profile_name)
-                
-                # For first row in column, split from the column's main pane
-                # For subsequent rows, split from the previous row
-                parent_position = f"{column}/{previous_row}/1"
-                parent_session = sessions.get(parent_position)
-                
-                if not parent_session:
-                    logger.warning(f"Parent session not found for {parent_position}")
-                    continue
-                
-                # Create horizontal split from the parent
-                new_session = await parent_session.async_split_pane(vertical=False, profile=pane_profile)
-                position = f"{column}/{row}/1"
-                sessions[position] = new_session
-                
-                # Update previous row for next iteration
-                previous_row = row
-                
-                # Apply settings
-                if pane.get('title'):
-                    await new_session.async_set_name(pane.get('title'))
-                
-                if pane.get('color'):
-                    await new_session.async_set_color_preset(pane.get('color'))
-                
-                if pane.get('badge'):
-                    await ITermManager.add_badge(new_session, pane.get('badge'))
-                
-                if pane.get('focus'):
-                    focus_session = new_session
-                
-                # Execute commands
-                commands = pane.get('commands', [])
-                delay = pane.get('command_delay', 0)
-                working_dir = pane.get('working_directory')
-                
-                if not working_dir and pane.get('root'):
-                    working_dir = pane.get('root')
-                
-                await CommandExecutor.execute_commands(new_session, commands, delay, working_dir, pane)
+            pane = panes_by_pos[pos]
+            working_dir = pane.get('working_directory') or pane.get('root')
+            jobs.append((session, pane.get('commands', []), pane.get('command_delay', 0), working_dir, pane))
         
-        # Finally, process columns within rows (the third level of hierarchy)
-        for column in columns:
-            for row in column_map.get(column, {}).keys():
-                cols_in_row = sorted([c for c in column_map[column][row].keys() if c > 1])
-                
-                if not cols_in_row:
-                    continue
-                    
-                # Create columns sequentially within this row
-                previous_col_in_row = 1
-                for col_in_row in cols_in_row:
-                    pane = column_map[column][row][col_in_row]
-                    pane_profile = pane.get('profile', profile_name)
-                    
-                    # Get parent - the previous column in this row
-                    parent_position = f"{column}/{row}/{previous_col_in_row}"
-                    parent_session = sessions.get(parent_position)
-                    
-                    if not parent_session:
-                        logger.warning(f"Parent session not found for {parent_position}")
-                        continue
-                    
-                    # Create vertical split within the row
-                    new_session = await parent_session.async_split_pane(vertical=True, profile=pane_profile)
-                    position = f"{column}/{row}/{col_in_row}"
-                    sessions[position] = new_session
-                    
-                    # Update previous column for next iteration
-                    previous_col_in_row = col_in_row
-                    
-                    # Apply settings
-                    if pane.get('title'):
-                        await new_session.async_set_name(pane.get('title'))
-                    
-                    if pane.get('color'):
-                        await new_session.async_set_color_preset(pane.get('color'))
-                    
-                    if pane.get('badge'):
-                        await ITermManager.add_badge(new_session, pane.get('badge'))
-                    
-                    if pane.get('focus'):
-                        focus_session = new_session
-                    
-                    # Execute commands
-                    commands = pane.get('commands', [])
-                    delay = pane.get('command_delay', 0)
-                    working_dir = pane.get('working_directory')
-                    
-                    if not working_dir and pane.get('root'):
-                        working_dir = pane.get('root')
-                    
-                    await CommandExecutor.execute_commands(new_session, commands, delay, working_dir, pane)
+        # execute_commands logs its own failures; one pane failing doesn't stop the others
+        await CommandExecutor.execute_many(jobs)
         
         # Set focus to the specified session
-        await focus_session.async_activate()
+        focus_session = sessions.get(focus_position, current_session)
+        ITermManager.defer(focus_session.async_activate())
         
-        return sessions
+        return {"{}/{}/{}".format(*pos): session for pos, session in sessions.items()}
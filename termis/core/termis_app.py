@@ -3,8 +3,7 @@
 import os
 import logging
 import asyncio
-from typing import Dict, Any, Optional
-import iterm2
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 from ..config.config_loader import ConfigLoader
 from ..exceptions.termis_exceptions import TermisException, ConfigurationError
@@ -16,8 +15,54 @@ from ..cli.wizard import ConfigWizard
 from .command_executor import CommandExecutor
 from ..integrations.tools_coordinator import ToolsCoordinator
 
+if TYPE_CHECKING:
+    import iterm2
+
 logger = logging.getLogger('termis.app')
 
+def _deep_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge overlay into base in place, keeping the values base already has.
+    
+    Top-level keys missing from base are appended. Where both sides hold a
+    dictionary the merged one lists overlay's keys first, so profile tabs keep
+    coming before the config's own ones.
+    
+    Args:
+        base: Configuration whose values take precedence
+        overlay: Configuration supplying missing keys
+        
+    Returns:
+        The updated base dictionary
+    """
+    for key, value in overlay.items():
+        current = base.setdefault(key, value)
+        if current is not value and isinstance(current, dict) and isinstance(value, dict):
+            base[key] = _merged_dict(current, value)
+    return base
+
+def _merged_dict(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge two dictionaries into a new one ordered overlay first, base values winning.
+    
+    Args:
+        base: Dictionary whose values take precedence
+        overlay: Dictionary whose key order comes first
+        
+    Returns:
+        The merged dictionary
+    """
+    merged = {}
+    for key, value in overlay.items():
+        if key not in base:
+            merged[key] = value
+        elif isinstance(base[key], dict) and isinstance(value, dict):
+            # Merge dictionaries recursively
+            merged[key] = _merged_dict(base[key], value)
+        else:
+            merged[key] = base[key]
+    for key, value in base.items():
+        merged.setdefault(key, value)
+    return merged
+
 class TermisApp:
     """Main Termis application class."""
     
@@ -28,13 +73,16 @@ class TermisApp:
         self.profile_manager = ProfileManager()
         self.command_executor = CommandExecutor()
     
-    async def activate(self, connection: iterm2.Connection, args: Dict[str, Any]) -> None:
+    async def activate(self, connection: 'iterm2.Connection', args: Dict[str, Any]) -> None:
         """Main entry point for the application.
         
         Args:
             connection: iTerm2 connection
             args: Command line arguments
         """
+        # Profiles may have been edited in iTerm2 since a previous activation
+        self.iterm_manager.clear_profile_cache()
+        
         try:
             if args.get('version'):
                 print(VERSION)
@@ -48,9 +96,15 @@ class TermisApp:
             if args.get('tools_check'):                
                 print("Checking available development tools:")
                 
-                for tool in ToolsCoordinator.TOOLS_MAP.keys():
-                    integration = ToolsCoordinator.get_tool_integration(tool)
-                    available = integration.is_available()
+                # Probe every tool concurrently; results come back in TOOLS_MAP order
+                loop = asyncio.get_running_loop()
+                tools = list(ToolsCoordinator.TOOLS_MAP.items())
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(None, integration.is_available)
+                    for _, integration in tools
+                ))
+                
+                for (tool, _), available in zip(tools, results):
                     status = "Available" if available else "Not available"
                     print(f"  {tool:10}: {status}")       
                 return
@@ -86,7 +140,16 @@ class TermisApp:
             profile_name = config.get('profile') or 'Default'
             dry_run = args.get('dry_run', False)
             
+            # Probe the known tools while the window and tabs are set up; the
+            # config is not inspected here so malformed tabs only fail on their own
+            warm_tools = None
+            if not dry_run:
+                warm_tools = asyncio.get_running_loop().run_in_executor(
+                    None, ToolsCoordinator.warm_availability
+                )
+            
             # Get iTerm2 app instance and window
+            import iterm2
             app = await iterm2.async_get_app(connection, True)
             initial_win = await self.iterm_manager.get_current_window(
                 app, connection, args.get('new'), profile_name
@@ -97,6 +160,9 @@ class TermisApp:
                 logger.info(f"Would use profile: {profile_name}")
                 logger.info(f"Would configure {len(config.get('tabs', {}))} tabs")
             
+            if warm_tools:
+                await warm_tools
+            
             # Process tabs
             await self._process_tabs(config.get('tabs', {}), initial_win, profile_name, dry_run)
             
@@ -109,6 +175,9 @@ class TermisApp:
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             print(f"Unexpected error: {e}")
+        finally:
+            # Wait for the window, tab and focus RPCs that were sent in the background
+            await self.iterm_manager.flush_pending()
     
     async def _handle_wizard_mode(self) -> tuple[str, Dict[str, Any]]:
         """Handle wizard mode configuration.
@@ -166,12 +235,7 @@ class TermisApp:
             # Merge with profile if specified
             if profile_config:
                 # Deep merge profile config with main config
-                for key, value in profile_config.items():
-                    if key not in config:
-                        config[key] = value
-                    elif isinstance(value, dict) and isinstance(config[key], dict):
-                        # Merge dictionaries recursively
-                        config[key] = {**value, **config[key]}
+                _deep_merge(config, profile_config)
             
             return config
             
@@ -180,7 +244,7 @@ class TermisApp:
             print(f"Error: {e}")
             return None
     
-    async def _process_tabs(self, tabs_config: Dict[str, Any], window: iterm2.Window,
+    async def _process_tabs(self, tabs_config: Dict[str, Any], window: 'iterm2.Window',
                           profile_name: str, dry_run: bool = False) -> Dict[str, Any]:
         """Process all tabs in parallel.
         
@@ -193,32 +257,35 @@ class TermisApp:
         Returns:
             Dictionary of tab results
         """
-        tab_results = {}
-        first_tab = True
-        
-        # Create a list of tasks for processing tabs
-        tasks = []
-        
-        for tab_id, tab_config in tabs_config.items():
-            task = asyncio.create_task(
-                self._process_tab(tab_id, tab_config, window, profile_name, first_tab, dry_run)
-            )
-            tasks.append((tab_id, task))
-            first_tab = False
-        
-        # Wait for all tasks to complete
-        for tab_id, task in tasks:
+        async def run_tab(tab_id: str, tab_config: Dict[str, Any], first_tab: bool) -> Optional[Dict[str, Any]]:
+            # Contain failures to their own tab so sibling tabs keep running
             try:
-                result = await task
-                if result:
-                    tab_results[tab_id] = result
+                return await self._process_tab(tab_id, tab_config, window, profile_name, first_tab, dry_run)
             except Exception as e:
                 logger.error(f"Error in tab '{tab_id}': {e}")
+                return None
+        
+        coros = [
+            run_tab(tab_id, tab_config, index == 0)
+            for index, (tab_id, tab_config) in enumerate(tabs_config.items())
+        ]
+        
+        if hasattr(asyncio, 'TaskGroup'):
+            # Python 3.11+: structured concurrency, nothing outlives this block
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(coro) for coro in coros]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(*coros)
         
-        return tab_results
+        return {
+            tab_id: result
+            for tab_id, result in zip(tabs_config.keys(), results)
+            if result
+        }
     
     async def _process_tab(self, tab_id: str, tab_config: Dict[str, Any], 
-                         window: iterm2.Window, profile_name: str,
+                         window: 'iterm2.Window', profile_name: str,
                          first_tab: bool = False, dry_run: bool = False) -> Optional[Dict[str, Any]]:
         """Process a single tab configuration.
         
@@ -246,7 +313,7 @@ class TermisApp:
                 curr_tab = window.current_tab
                 # Set tab title if provided
                 if tab_config.get('title'):
-                    await curr_tab.async_set_title(tab_config.get('title'))
+                    self.iterm_manager.defer(curr_tab.async_set_title(tab_config.get('title')))
             else:
                 curr_tab = await self.iterm_manager.create_tab_with_config(
                     window, tab_config, tab_id, profile_name, dry_run
@@ -265,13 +332,13 @@ class TermisApp:
                     pane['root'] = root_path
                 
                 # Format commands
-                pane['commands'] = await self.command_executor.format_commands(
+                pane['commands'] = self.command_executor.format_commands(
                     commands, pane.get('prompt', '')
                 )
             
             # Render the panes for this tab
             sessions_ref = await self.iterm_manager.render_tab_panes(
-                curr_tab, tab_panes, profile_name, dry_run
+                curr_tab, tab_panes, profile_name, dry_run, tab_config.get('title')
             )
             
             # Return the tab and session references
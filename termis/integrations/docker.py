@@ -6,6 +6,8 @@ from .tool_base import ToolIntegration
 class DockerIntegration(ToolIntegration):
     """Handles Docker specific integrations."""
     
+    __slots__ = ()
+    
     @staticmethod
     def is_available() -> bool:
         """Check if Docker is available."""
@@ -25,51 +27,54 @@ class DockerIntegration(ToolIntegration):
         commands = []
         
         # Run docker-compose if specified
-        if docker_config.get('compose'):
-            compose_cmd = "docker-compose"
-            if docker_config.get('compose_file'):
-                compose_cmd += f" -f {docker_config['compose_file']}"
-            compose_cmd += f" {docker_config['compose']}"
-            commands.append(compose_cmd)
+        compose = docker_config.get('compose')
+        if compose:
+            compose_parts = ["docker-compose"]
+            compose_file = docker_config.get('compose_file')
+            if compose_file:
+                compose_parts.append(f"-f {compose_file}")
+            compose_parts.append(str(compose))
+            commands.append(" ".join(compose_parts))
             
         # Run a container if specified
-        if docker_config.get('run'):
-            run_config = docker_config['run']
-            run_cmd = "docker run"
+        run_config = docker_config.get('run')
+        if run_config:
+            run_parts = ["docker", "run"]
+            ports = run_config.get('ports')
+            volumes = run_config.get('volumes')
+            env = run_config.get('env')
+            command = run_config.get('command')
             
             # Add options
             if run_config.get('detach'):
-                run_cmd += " -d"
+                run_parts.append("-d")
             if run_config.get('interactive'):
-                run_cmd += " -it"
-            if run_config.get('ports'):
-                for port_map in run_config['ports']:
-                    run_cmd += f" -p {port_map}"
-            if run_config.get('volumes'):
-                for vol_map in run_config['volumes']:
-                    run_cmd += f" -v {vol_map}"
-            if run_config.get('env'):
-                for key, value in run_config['env'].items():
-                    run_cmd += f" -e {key}={value}"
+                run_parts.append("-it")
+            if ports:
+                run_parts.extend(f"-p {port_map}" for port_map in ports)
+            if volumes:
+                run_parts.extend(f"-v {vol_map}" for vol_map in volumes)
+            if env:
+                run_parts.extend(f"-e {key}={value}" for key, value in env.items())
             
             # Add image and command
-            run_cmd += f" {run_config['image']}"
-            if run_config.get('command'):
-                run_cmd += f" {run_config['command']}"
+            run_parts.append(str(run_config['image']))
+            if command:
+                run_parts.append(str(command))
                 
-            commands.append(run_cmd)
+            commands.append(" ".join(run_parts))
             
         # Build an image if specified
-        if docker_config.get('build'):
-            build_config = docker_config['build']
-            build_cmd = f"docker build -t {build_config['tag']}"
+        build_config = docker_config.get('build')
+        if build_config:
+            build_parts = ["docker", "build", f"-t {build_config['tag']}"]
             
-            if build_config.get('dockerfile'):
-                build_cmd += f" -f {build_config['dockerfile']}"
+            dockerfile = build_config.get('dockerfile')
+            if dockerfile:
+                build_parts.append(f"-f {dockerfile}")
                 
-            context = build_config.get('context', '.')
-            build_cmd += f" {context}"
+            build_parts.append(str(build_config.get('context', '.')))
             
-            commands.append(build_cmd)
+            commands.append(" ".join(build_parts))
             
         return commands
\ No newline at end of file
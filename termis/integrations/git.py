@@ -6,6 +6,8 @@ from .tool_base import ToolIntegration
 class GitIntegration(ToolIntegration):
     """Handles Git specific integrations."""
     
+    __slots__ = ()
+    
     @staticmethod
     def is_available() -> bool:
         """Check if Git is available."""
@@ -25,25 +27,27 @@ class GitIntegration(ToolIntegration):
         commands = []
         
         # Clone repository if specified
-        if git_config.get('clone'):
-            repo_url = git_config['clone']
+        clone = git_config.get('clone')
+        if clone:
+            clone_parts = ["git", "clone", str(clone)]
             target_dir = git_config.get('target_dir', '')
-            clone_cmd = f"git clone {repo_url}"
             if target_dir:
-                clone_cmd += f" {target_dir}"
-            commands.append(clone_cmd)
+                clone_parts.append(str(target_dir))
+            commands.append(" ".join(clone_parts))
             
         # Checkout branch if specified
-        if git_config.get('checkout'):
-            commands.append(f"git checkout {git_config['checkout']}")
+        checkout = git_config.get('checkout')
+        if checkout:
+            commands.append(f"git checkout {checkout}")
             
         # Pull updates if specified
         if git_config.get('pull'):
             commands.append("git pull")
             
         # Set up git config if specified
-        if git_config.get('config'):
-            for key, value in git_config['config'].items():
+        config = git_config.get('config')
+        if config:
+            for key, value in config.items():
                 commands.append(f"git config {key} '{value}'")
                 
         return commands
\ No newline at end of file
@@ -1,15 +1,23 @@
 """Base class for tool integrations."""
 
 import shutil
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+@lru_cache(maxsize=None)
+def _which(tool_name: str) -> Optional[str]:
+    """Resolve an executable on PATH once per process."""
+    return shutil.which(tool_name)
+
 class ToolIntegration:
     """Base class for tool integrations."""
     
+    __slots__ = ()
+    
     @staticmethod
     def is_available(tool_name: str) -> bool:
         """Check if a tool is available in the system."""
-        return shutil.which(tool_name) is not None
+        return _which(tool_name) is not None
     
     @staticmethod
     def generate_commands(tool_config: Dict[str, Any], working_dir: Optional[str] = None) -> List[str]:
@@ -1,8 +1,9 @@
 """Tools integration coordinator module."""
 
 import logging
-from typing import Dict, Any, List, Optional, Type
-from .tool_base import ToolIntegration
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, Type
+from .tool_base import ToolIntegration, _which
 from .vscode import VSCodeIntegration
 from .git import GitIntegration
 from .docker import DockerIntegration
@@ -32,43 +33,100 @@ class ToolsCoordinator:
         return ToolsCoordinator.TOOLS_MAP.get(tool_name, ToolIntegration)
     
     @staticmethod
-    def process_tool_hooks(pane_config: Dict[str, Any], working_dir: Optional[str] = None) -> List[str]:
-        """Process tool hooks in pane configuration and return generated commands.
+    def warm_availability() -> None:
+        """Probe every known tool not checked yet concurrently and cache the results."""
+        missing = [name for name in _DISPATCH if name not in _AVAIL_CACHE]
+        if not missing:
+            return
+        
+        # Each probe is an independent walk over PATH
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            results = pool.map(lambda name: _DISPATCH[name][0](), missing)
+            for name, available in zip(missing, results):
+                _AVAIL_CACHE[name] = available
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached tool availability so the next check probes PATH again."""
+        _AVAIL_CACHE.clear()
+        _which.cache_clear()
+    
+    @staticmethod
+    def iter_tool_commands(pane_config: Dict[str, Any], working_dir: Optional[str] = None) -> Iterator[str]:
+        """Process tool hooks in pane configuration and yield generated commands.
         
         Args:
             pane_config: Configuration for the pane
             working_dir: Working directory for command execution
             
-        Returns:
-            List of commands to execute
+        Yields:
+            Commands to execute, in tool order and without duplicates
         """
-        commands = []
-        
         # Get tool hooks from pane configuration
         tools = pane_config.get('tools', {})
         
         # Ensure tools is a dictionary
         if not isinstance(tools, dict):
-            logger.warning(f"Tools configuration must be a dictionary, got {type(tools)}")
-            return commands
+            logger.warning("Tools configuration must be a dictionary, got %s", type(tools))
+            return
         
         # Process each tool
+        seen = set()
         for tool_name, tool_config in tools.items():
+            # Get the availability check and command generator for this tool
+            dispatch = _DISPATCH.get(tool_name)
+            if dispatch is None:
+                logger.warning("Unknown tool '%s', skipping", tool_name)
+                continue
+            
+            # A tool key with nothing under it has nothing to generate
+            if tool_config is None:
+                continue
+            
+            is_available, generate_commands = dispatch
+            
+            # Check if the tool is available, probing each tool once per process
+            available = _AVAIL_CACHE.get(tool_name)
+            if available is None:
+                available = _AVAIL_CACHE[tool_name] = is_available()
+            
+            if not available:
+                logger.warning("Tool '%s' is not available on this system", tool_name)
+                continue
+            
+            # Generate commands for this tool
             try:
-                # Get the integration class for this tool
-                integration_class = ToolsCoordinator.get_tool_integration(tool_name)
-                
-                # Check if the tool is available
-                if integration_class.is_available():
-                    # Generate commands for this tool
-                    tool_commands = integration_class.generate_commands(tool_config, working_dir)
-                    logger.info(f"TOOLS: {tool_commands}")
-                    if tool_commands:
-                        commands.extend(tool_commands)
-                else:
-                    logger.warning(f"Tool '{tool_name}' is not available on this system")
+                tool_commands = generate_commands(tool_config, working_dir)
             except Exception as e:
-                logger.error(f"Error processing tool '{tool_name}': {e}")
+                logger.error("Error processing tool '%s': %s", tool_name, e)
                 continue
+            
+            logger.info("TOOLS: %s", tool_commands)
+            
+            # Tools can generate the same command; run each one only once
+            for command in tool_commands or ():
+                if command not in seen:
+                    seen.add(command)
+                    yield command
+    
+    @staticmethod
+    def process_tool_hooks(pane_config: Dict[str, Any], working_dir: Optional[str] = None) -> List[str]:
+        """Process tool hooks in pane configuration and return generated commands.
         
-        return commands
\ No newline at end of file
+        Args:
+            pane_config: Configuration for the pane
+            working_dir: Working directory for command execution
+            
+        Returns:
+            List of commands to execute
+        """
+        return list(ToolsCoordinator.iter_tool_commands(pane_config, working_dir))
+
+# Availability check and command generator per tool, resolved once at import
+_DISPATCH: Dict[str, Tuple[Callable[[], bool], Callable[..., List[str]]]] = {
+    name: (integration.is_available, integration.generate_commands)
+    for name, integration in ToolsCoordinator.TOOLS_MAP.items()
+}
+
+# Availability per tool name, filled on first use
+_AVAIL_CACHE: Dict[str, bool] = {}
\ No newline at end of file
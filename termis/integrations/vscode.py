@@ -1,16 +1,25 @@
 """VS Code integration module."""
 
-import shutil
 from typing import Dict, Any, List, Optional
-from .tool_base import ToolIntegration
+from .tool_base import ToolIntegration, _which
 
 class VSCodeIntegration(ToolIntegration):
     """Handles VS Code specific integrations."""
     
+    __slots__ = ()
+    
+    @staticmethod
+    def _code_command() -> Optional[str]:
+        """Get the VS Code launcher on PATH, preferring the stable build."""
+        for code_cmd in ("code", "code-insiders"):
+            if _which(code_cmd) is not None:
+                return code_cmd
+        return None
+    
     @staticmethod
     def is_available() -> bool:
         """Check if VS Code is available."""
-        return shutil.which("code") is not None or shutil.which("code-insiders") is not None
+        return VSCodeIntegration._code_command() is not None
     
     @staticmethod
     def generate_commands(vscode_config: Dict[str, Any], working_dir: Optional[str] = None) -> List[str]:
@@ -26,28 +35,27 @@ class VSCodeIntegration(ToolIntegration):
         commands = []
         
         # Determine which VS Code command to use
-        code_cmd = "code" if shutil.which("code") is not None else "code-insiders"
+        code_cmd = VSCodeIntegration._code_command() or "code-insiders"
         
         # Build the command based on configuration
-        base_cmd = code_cmd
+        base_parts = [code_cmd]
         
         # Open folder if specified
         if working_dir:
-            base_cmd += f" {working_dir}"
+            base_parts.append(working_dir)
         
         # Add specified files
         if vscode_config.get('files'):
-            files = " ".join(vscode_config['files'])
-            base_cmd += f" {files}"
+            base_parts.extend(str(file) for file in vscode_config['files'])
             
         # Open in new window if specified
         if vscode_config.get('new_window'):
-            base_cmd += " --new-window"
+            base_parts.append("--new-window")
             
         # Use specific extensions
         if vscode_config.get('extensions'):
             for ext in vscode_config['extensions']:
                 commands.append(f"{code_cmd} --install-extension {ext}")
         
-        commands.append(base_cmd)
+        commands.append(" ".join(base_parts))
         return commands
\ No newline at end of file
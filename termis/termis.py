@@ -3,12 +3,15 @@
 
 import os
 import logging
-import iterm2
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict
 
 from .cli.parser import parse_arguments
-from .core.termis_app import TermisApp
 from .utils.constants import ERROR_LOG_PATH, GLOBAL_PROFILES_DIR
 
+if TYPE_CHECKING:
+    import iterm2
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,17 +22,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger('termis')
 
-async def activate(connection: iterm2.Connection) -> None:
+async def activate(connection: 'iterm2.Connection', args: Dict[str, Any]) -> None:
     """Main activation function for iTerm2 connection.
     
     Args:
         connection: iTerm2 connection instance
+        args: Parsed command line arguments
     """
-    try:
-        args = parse_arguments()
-    except SystemExit:
-        return
-
+    from .core.termis_app import TermisApp
+    
     # Create and run the Termis application
     app = TermisApp()
     await app.activate(connection, args)
@@ -40,8 +41,13 @@ def main() -> None:
     os.makedirs(os.path.dirname(ERROR_LOG_PATH), exist_ok=True)
     os.makedirs(GLOBAL_PROFILES_DIR, exist_ok=True)
     
+    # Parse arguments before connecting so --help and usage errors exit
+    # without loading the iTerm2 API
+    args = parse_arguments()
+    
     # Run the app
-    iterm2.run_until_complete(activate)
+    import iterm2
+    iterm2.run_until_complete(partial(activate, args=args))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
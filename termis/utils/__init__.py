@@ -1,6 +1,12 @@
 """Utility modules for Termis."""
 
 from .constants import VERSION, DEFAULT_CONFIG, GLOBAL_PROFILES_DIR
-from .profile_manager import ProfileManager
 
-__all__ = ['VERSION', 'DEFAULT_CONFIG', 'GLOBAL_PROFILES_DIR', 'ProfileManager']
\ No newline at end of file
+__all__ = ['VERSION', 'DEFAULT_CONFIG', 'GLOBAL_PROFILES_DIR', 'ProfileManager']
+
+def __getattr__(name):
+    # The profile manager pulls in yaml, so only import it once it is asked for
+    if name == 'ProfileManager':
+        from .profile_manager import ProfileManager
+        return ProfileManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
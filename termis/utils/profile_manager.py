@@ -2,14 +2,34 @@
 
 import os
 import re
+import heapq
 import shutil
+import sys
 import logging
 import yaml
-from typing import List, Tuple
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from ..exceptions.termis_exceptions import ConfigurationError
 
 logger = logging.getLogger('termis.utils')
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Valid global profile names; \Z also rejects a trailing newline, which $ lets through
+_PROFILE_NAME_RE = re.compile(r'\A[A-Za-z0-9_-]+\Z')
+
+# Bytes of a profile read before falling back to parsing the whole file
+_METADATA_PREFIX = 4096
+
+# Errors of a profile that can't be parsed; the safe loader's constructors
+# raise ValueError and TypeError (e.g. for an impossible date) unwrapped
+_PARSE_ERRORS = (yaml.YAMLError, ValueError, TypeError)
+
+# Rules framing the profiles listing
+_HEAD = "=" * 60
+_SEP = "-" * 60
+
 class ProfileManager:
     """Manages global profile configuration files."""
     
@@ -28,11 +48,8 @@ class ProfileManager:
         Raises:
             ConfigurationError: If profile name is invalid or config doesn't exist
         """
-        if not os.path.exists(config_path):
-            raise ConfigurationError(f"Configuration file does not exist: {config_path}")
-            
         # Ensure the profile name is valid
-        if not profile_name or not re.match(r'^[a-zA-Z0-9_-]+$', profile_name):
+        if not profile_name or not _PROFILE_NAME_RE.match(profile_name):
             raise ConfigurationError(
                 f"Invalid profile name: {profile_name}. "
                 "Use alphanumeric characters, underscores, and hyphens only."
@@ -41,12 +58,19 @@ class ProfileManager:
         # Create target path
         target_path = os.path.join(profiles_dir, f"{profile_name}.yml")
         
-        # Check if profile already exists
-        if os.path.exists(target_path):
+        # Claim the target name; failing with FileExistsError means the profile exists
+        created = False
+        try:
+            os.close(os.open(target_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            created = True
+        except FileExistsError:
             overwrite = input(f"Profile '{profile_name}' already exists. Overwrite? (y/n): ")
             if overwrite.lower() != 'y':
                 print("Operation cancelled.")
                 return False
+        except OSError as e:
+            logger.error("Error saving to global profile: %s", e)
+            raise ConfigurationError(f"Failed to save global profile: {e}")
         
         # Copy the file to the profiles directory
         try:
@@ -54,7 +78,12 @@ class ProfileManager:
             print(f"Configuration saved to global profile: {profile_name}")
             return True
         except Exception as e:
-            logger.error(f"Error saving to global profile: {e}")
+            # Don't leave an empty profile behind
+            if created:
+                os.remove(target_path)
+            if isinstance(e, FileNotFoundError) and e.filename == config_path:
+                raise ConfigurationError(f"Configuration file does not exist: {config_path}")
+            logger.error("Error saving to global profile: %s", e)
             raise ConfigurationError(f"Failed to save global profile: {e}")
     
     @staticmethod
@@ -70,26 +99,91 @@ class ProfileManager:
         if not os.path.exists(profiles_dir):
             print("No global profiles found.")
             return []
+        
+        return list(ProfileManager.iter_global_profiles(profiles_dir))
+    
+    @staticmethod
+    def iter_global_profiles(profiles_dir: str, limit: Optional[int] = None) -> Iterator[Tuple[str, str, str]]:
+        """Iterate over global profiles in name order.
+        
+        With a limit only that many profiles are kept while scanning, so showing
+        the first few of a large directory doesn't sort all of it.
+        
+        Args:
+            profiles_dir: Directory containing global profiles
+            limit: Maximum number of profiles to return, all if None
+            
+        Returns:
+            Iterator of tuples containing (profile_name, display_name, description)
+        """
+        profiles = ProfileManager._scan_profiles(profiles_dir)
+        if limit is None:
+            return iter(sorted(profiles, key=itemgetter(0)))
+        return iter(heapq.nsmallest(limit, profiles, key=itemgetter(0)))
+    
+    @staticmethod
+    def _scan_profiles(profiles_dir: str) -> Iterator[Tuple[str, str, str]]:
+        """Read the name and metadata of each profile file, in directory order.
+        
+        Args:
+            profiles_dir: Directory containing global profiles
             
-        profiles = []
-        for file in os.listdir(profiles_dir):
-            if file.endswith('.yml'):
-                profile_name = file[:-4]  # Remove .yml extension
-                profile_path = os.path.join(profiles_dir, file)
+        Yields:
+            Tuples containing (profile_name, display_name, description)
+        """
+        if not os.path.isdir(profiles_dir):
+            return
+        
+        with os.scandir(profiles_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.yml') or not entry.is_file():
+                    continue
+                profile_name = entry.name[:-4]  # Remove .yml extension
                 
                 # Try to get metadata from the profile
                 try:
-                    with open(profile_path) as f:
-                        config = yaml.safe_load(f)
-                    metadata = config.get('metadata', {})
+                    metadata = ProfileManager._read_metadata(entry.path)
                     name = metadata.get('name', profile_name)
                     description = metadata.get('description', '')
-                    profiles.append((profile_name, name, description))
-                except:
+                    yield profile_name, name, description
+                except (OSError, *_PARSE_ERRORS):
                     # If we can't read the config, just use the filename
-                    profiles.append((profile_name, profile_name, ''))
+                    yield profile_name, profile_name, ''
+    
+    @staticmethod
+    def _read_metadata(profile_path: str) -> Dict[str, Any]:
+        """Read the metadata block of a profile, parsing as little of it as possible.
+        
+        Metadata conventionally comes first, so the first few KiB are parsed on
+        their own. The whole file is parsed only when that prefix is cut inside
+        the document or doesn't hold a complete metadata block.
         
-        return sorted(profiles)
+        Args:
+            profile_path: Path to the profile file
+            
+        Returns:
+            Metadata dictionary, empty if the profile has none
+        """
+        with open(profile_path, 'rb') as f:
+            data = f.read(_METADATA_PREFIX)
+            if len(data) == _METADATA_PREFIX:
+                try:
+                    config = yaml.load(data, Loader=Loader)
+                except _PARSE_ERRORS:
+                    config = None
+                
+                # metadata is complete if another top-level key follows it
+                if isinstance(config, dict) and 'metadata' in config and list(config)[-1] != 'metadata':
+                    return ProfileManager._as_metadata(config['metadata'])
+                data += f.read()
+        
+        config = yaml.load(data, Loader=Loader)
+        return ProfileManager._as_metadata(config.get('metadata') if isinstance(config, dict) else None)
+    
+    @staticmethod
+    def _as_metadata(metadata: Any) -> Dict[str, Any]:
+        """Treat a missing or malformed metadata block as empty."""
+        return metadata if isinstance(metadata, dict) else {}
     
     @staticmethod
     def print_profiles_list(profiles: List[Tuple[str, str, str]]) -> None:
@@ -102,10 +196,11 @@ class ProfileManager:
             print("No global profiles found.")
             return
             
-        print("Available global profiles:")
-        print("=" * 60)
+        # Build the listing up front and write it in one go
+        lines = ["Available global profiles:", _HEAD]
         for profile_name, name, description in profiles:
-            print(f"{profile_name:20} | {name}")
+            lines.append(f"{profile_name:20} | {name}")
             if description:
-                print(f"{' ':20} | {description}")
-            print("-" * 60)
\ No newline at end of file
+                lines.append(f"{' ':20} | {description}")
+            lines.append(_SEP)
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
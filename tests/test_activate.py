@@ -0,0 +1,51 @@
+"""Tests for TermisApp.activate start-up handling."""
+
+import asyncio
+import sys
+import types
+import unittest
+from unittest import mock
+
+from termis.core.termis_app import TermisApp
+from termis.integrations.tools_coordinator import ToolsCoordinator
+
+
+class ActivateTest(unittest.TestCase):
+    """Malformed tabs fail on their own without stopping the run."""
+
+    def test_empty_tab_does_not_stop_other_tabs(self):
+        config = {'tabs': {'broken': None, 'ok': {'panes': [{'position': '1/1', 'commands': ['ls']}]}}}
+        processed = []
+
+        async def process_tab(tab_id, tab_config, *args):
+            processed.append(tab_id)
+            if tab_config is None:
+                raise AttributeError("'NoneType' object has no attribute 'get'")
+            return {'tab': tab_id, 'sessions': {}}
+
+        async def get_app(connection, create_if_needed):
+            return object()
+
+        async def get_window(*args):
+            return object()
+
+        async def load_configuration(args):
+            return config
+
+        app = TermisApp()
+        fake_iterm2 = types.SimpleNamespace(async_get_app=get_app)
+        with mock.patch.dict(sys.modules, {'iterm2': fake_iterm2}), \
+                mock.patch.object(app, '_load_configuration', load_configuration), \
+                mock.patch.object(app, '_process_tab', process_tab), \
+                mock.patch.object(app.iterm_manager, 'get_current_window', get_window), \
+                mock.patch.object(ToolsCoordinator, 'warm_availability') as warm, \
+                mock.patch('builtins.print') as printed:
+            asyncio.run(app.activate(None, {}))
+
+        self.assertEqual(processed, ['broken', 'ok'])
+        warm.assert_called_once_with()
+        self.assertFalse(any('Unexpected error' in str(call) for call in printed.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the parsed-config cache in the config loader."""
+
+import json
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from termis.config import config_loader
+from termis.config.config_loader import CACHE_SUFFIX, ConfigLoader
+
+
+class ConfigCacheTest(unittest.TestCase):
+    """Freshness and persistence rules of the config cache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        self.config_path = os.path.join(self.dir, 'termis.yml')
+        self.cache_path = self.config_path + CACHE_SUFFIX
+        config_loader._CONFIG_CACHE.clear()
+        self.addCleanup(config_loader._CONFIG_CACHE.clear)
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, path, text):
+        """Write a file and move its mtime forward so the change is always seen."""
+        existed = os.path.exists(path)
+        mtime = os.stat(path).st_mtime_ns if existed else 0
+        with open(path, 'w') as f:
+            f.write(text)
+        if existed:
+            os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    def read(self, **kwargs):
+        return ConfigLoader.read_config(self.config_path, **kwargs)
+
+    def forget_memory(self):
+        """Drop the in-process cache so the next read has to use the sidecar."""
+        config_loader._CONFIG_CACHE.clear()
+
+    def test_plain_config_is_persisted_owner_only(self):
+        self.write(self.config_path, "profile: Work\n")
+
+        self.assertEqual(self.read(), {'profile': 'Work'})
+
+        with open(self.cache_path) as f:
+            self.assertEqual(json.load(f)['config'], {'profile': 'Work'})
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode) & 0o077, 0)
+
+    def test_sidecar_is_used_without_reparsing(self):
+        self.write(self.config_path, "profile: Work\n")
+        self.read()
+        self.forget_memory()
+
+        with mock.patch.object(config_loader.yaml, 'load', side_effect=AssertionError("reparsed")):
+            self.assertEqual(self.read(), {'profile': 'Work'})
+
+    def test_cached_config_is_a_copy(self):
+        self.write(self.config_path, "tabs:\n  a:\n    title: A\n")
+        self.read()['tabs']['a']['title'] = 'changed'
+
+        self.assertEqual(self.read()['tabs']['a']['title'], 'A')
+
+    def test_config_change_invalidates(self):
+        self.write(self.config_path, "profile: Work\n")
+        self.read()
+
+        self.write(self.config_path, "profile: Home\n")
+        self.assertEqual(self.read(), {'profile': 'Home'})
+
+        self.forget_memory()
+        self.assertEqual(self.read(), {'profile': 'Home'})
+
+    def test_include_change_invalidates(self):
+        include_path = os.path.join(self.dir, 'panes.yml')
+        self.write(include_path, "- position: '1/1'\n")
+        self.write(self.config_path, "panes: !include panes.yml\n")
+        self.assertEqual(self.read(), {'panes': [{'position': '1/1'}]})
+
+        self.write(include_path, "- position: '1/1'\n- position: '2/1'\n")
+        self.assertEqual(len(self.read()['panes']), 2)
+
+        self.write(include_path, "- position: '3/1'\n")
+        self.forget_memory()
+        self.assertEqual(self.read(), {'panes': [{'position': '3/1'}]})
+
+    def test_env_config_is_never_written_to_disk(self):
+        self.write(self.config_path, "token: ${TERMIS_TEST_TOKEN}\n")
+
+        with mock.patch.dict(os.environ, {'TERMIS_TEST_TOKEN': 's3cr3t'}):
+            self.assertEqual(self.read(), {'token': 's3cr3t'})
+
+        self.assertFalse(os.path.exists(self.cache_path))
+        for name in os.listdir(self.dir):
+            with open(os.path.join(self.dir, name)) as f:
+                self.assertNotIn('s3cr3t', f.read())
+
+    def test_env_change_invalidates(self):
+        self.write(self.config_path, "token: ${TERMIS_TEST_TOKEN}\n")
+
+        with mock.patch.dict(os.environ, {'TERMIS_TEST_TOKEN': 'one'}):
+            self.assertEqual(self.read(), {'token': 'one'})
+        with mock.patch.dict(os.environ, {'TERMIS_TEST_TOKEN': 'two'}):
+            self.assertEqual(self.read(), {'token': 'two'})
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertEqual(self.read(), {'token': 'TERMIS_TEST_TOKEN'})
+
+    def test_switching_to_env_removes_old_sidecar(self):
+        self.write(self.config_path, "token: plain\n")
+        self.read()
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        self.write(self.config_path, "token: ${TERMIS_TEST_TOKEN}\n")
+        with mock.patch.dict(os.environ, {'TERMIS_TEST_TOKEN': 's3cr3t'}):
+            self.read()
+
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_sidecar_with_env_values_is_discarded(self):
+        self.write(self.config_path, "token: ${TERMIS_TEST_TOKEN}\n")
+        stamp = config_loader._file_stamp(os.path.abspath(self.config_path))
+        with open(self.cache_path, 'w') as f:
+            json.dump({
+                'tag': '!ENV',
+                'files': {os.path.abspath(self.config_path): stamp},
+                'env': {'TERMIS_TEST_TOKEN': 'old'},
+                'config': {'token': 'old'},
+            }, f)
+
+        with mock.patch.dict(os.environ, {'TERMIS_TEST_TOKEN': 'old'}):
+            self.assertEqual(self.read(), {'token': 'old'})
+
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_config_without_json_round_trip_stays_in_memory(self):
+        self.write(self.config_path, "ports:\n  80: web\n")
+
+        self.assertEqual(self.read(), {'ports': {80: 'web'}})
+        self.assertFalse(os.path.exists(self.cache_path))
+        self.assertEqual(self.read(), {'ports': {80: 'web'}})
+
+    def test_dry_run_writes_nothing(self):
+        self.write(self.config_path, "profile: Work\n")
+
+        self.assertEqual(self.read(dry_run=True), {'profile': 'Work'})
+        self.assertFalse(os.path.exists(self.cache_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
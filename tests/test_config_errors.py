@@ -0,0 +1,51 @@
+"""Tests for how the config loader reports broken YAML."""
+
+import os
+import tempfile
+import unittest
+
+from termis.config import config_loader
+from termis.config.config_loader import ConfigLoader
+from termis.exceptions.termis_exceptions import ConfigurationError
+
+
+class ConfigErrorTest(unittest.TestCase):
+    """Parse errors name the file that failed to parse."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        config_loader._CONFIG_CACHE.clear()
+        self.addCleanup(config_loader._CONFIG_CACHE.clear)
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_broken_config_names_the_config_file(self):
+        config_path = self.write('termis.yml', "profile: Work\ntabs: [1\n  a: b\n")
+
+        with self.assertRaises(ConfigurationError) as caught:
+            ConfigLoader.read_config(config_path)
+
+        message = str(caught.exception)
+        self.assertIn(config_path, message)
+        self.assertNotIn('<byte string>', message)
+
+    def test_broken_include_names_the_included_file(self):
+        config_path = self.write('termis.yml', "panes: !include panes.yml\n")
+        include_path = self.write('panes.yml', "- position: [1\n- title: x\n")
+
+        with self.assertRaises(ConfigurationError) as caught:
+            ConfigLoader.read_config(config_path)
+
+        message = str(caught.exception)
+        self.assertIn(include_path, message)
+        self.assertNotIn('<byte string>', message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for listing global profiles."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from termis.utils import profile_manager
+from termis.utils.profile_manager import ProfileManager
+
+
+class ProfileListingTest(unittest.TestCase):
+    """Profiles that can't be parsed are listed under their file name."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        self.addCleanup(self._tmp.cleanup)
+
+    def write(self, name, text):
+        with open(os.path.join(self.dir, name), 'w') as f:
+            f.write(text)
+
+    def test_unparsable_profiles_fall_back_to_file_name(self):
+        self.write('good.yml', "metadata:\n  name: Good\n  description: Works\ntabs: {}\n")
+        self.write('bad_date.yml', "metadata:\n  name: Dated\n  created: 2024-13-01\n")
+        self.write('bad_yaml.yml', "metadata: [1\n  name: x\n")
+
+        profiles = ProfileManager.list_global_profiles(self.dir)
+
+        self.assertEqual(profiles, [
+            ('bad_date', 'bad_date', ''),
+            ('bad_yaml', 'bad_yaml', ''),
+            ('good', 'Good', 'Works'),
+        ])
+
+    def test_bad_date_past_the_prefix_falls_back_to_file_name(self):
+        padding = "".join(f"  k{i}: {'x' * 60}\n" for i in range(80))
+        self.write('late.yml', f"metadata:\n  name: Late\n{padding}  created: 2024-13-01\n")
+
+        self.assertEqual(ProfileManager.list_global_profiles(self.dir), [('late', 'late', '')])
+
+    def test_interrupt_is_not_swallowed(self):
+        self.write('good.yml', "metadata:\n  name: Good\n")
+
+        with mock.patch.object(profile_manager.yaml, 'load', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                ProfileManager.list_global_profiles(self.dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Tests for merging a global profile into the main config."""
+
+import unittest
+
+from termis.core.termis_app import _deep_merge
+
+
+class ProfileMergeTest(unittest.TestCase):
+    """Precedence and key order of _deep_merge."""
+
+    def test_profile_tabs_come_first(self):
+        config = {'tabs': {'a': {'title': 'A'}, 'b': {'title': 'B'}}}
+        profile = {'tabs': {'p': {'title': 'P'}, 'a': {'title': 'profile A'}}}
+
+        merged = _deep_merge(config, profile)
+
+        self.assertIs(merged, config)
+        self.assertEqual(list(merged['tabs']), ['p', 'a', 'b'])
+
+    def test_main_config_values_win(self):
+        config = {'profile': 'Work', 'tabs': {'a': {'title': 'A'}}}
+        profile = {'profile': 'Home', 'tabs': {'a': {'title': 'profile A', 'root': '/src'}}}
+
+        merged = _deep_merge(config, profile)
+
+        self.assertEqual(merged['profile'], 'Work')
+        self.assertEqual(merged['tabs']['a'], {'title': 'A', 'root': '/src'})
+
+    def test_missing_top_level_keys_are_appended(self):
+        config = {'profile': 'Work'}
+        profile = {'tabs': {'p': {}}, 'profile': 'Home'}
+
+        merged = _deep_merge(config, profile)
+
+        self.assertEqual(list(merged), ['profile', 'tabs'])
+        self.assertEqual(merged['tabs'], {'p': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
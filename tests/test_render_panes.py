@@ -0,0 +1,111 @@
+"""Tests for splitting and configuring panes in ITermManager.render_tab_panes."""
+
+import asyncio
+import gc
+import unittest
+import warnings
+
+from termis.core.iterm_manager import ITermManager
+
+
+class FakeSession:
+    """Session stand-in recording splits; optionally slow or failing to split."""
+
+    def __init__(self, log, split_delay=0, fail_at=None, child_split_delay=0):
+        self.log = log
+        self.split_delay = split_delay
+        self.fail_at = fail_at
+        self.child_split_delay = child_split_delay
+        self.splits = 0
+        self.name = None
+        self.children = []
+
+    async def async_split_pane(self, vertical=False, profile=None):
+        self.splits += 1
+        await asyncio.sleep(self.split_delay)
+        if self.splits == self.fail_at:
+            raise RuntimeError("split failed")
+        child = FakeSession(self.log, split_delay=self.child_split_delay)
+        self.children.append(child)
+        self.log.append(('split', vertical))
+        return child
+
+    async def async_set_name(self, name):
+        await asyncio.sleep(0)
+        self.name = name
+
+    async def async_send_text(self, text):
+        pass
+
+    async def async_activate(self):
+        pass
+
+
+class FakeTab:
+    def __init__(self, session):
+        self.current_session = session
+
+
+class RenderTabPanesTest(unittest.TestCase):
+    """Split order, pane settings and failure handling."""
+
+    def render(self, session, panes):
+        async def run():
+            try:
+                return await ITermManager.render_tab_panes(FakeTab(session), panes, 'Default')
+            finally:
+                await ITermManager.flush_pending()
+        return asyncio.run(run())
+
+    def test_panes_are_split_and_named(self):
+        log = []
+        root = FakeSession(log)
+        panes = [
+            {'position': '1/1', 'title': 'A'},
+            {'position': '2/1', 'title': 'B'},
+            {'position': '1/2', 'title': 'C'},
+        ]
+
+        sessions = self.render(root, panes)
+
+        self.assertEqual(log, [('split', True), ('split', False)])
+        self.assertEqual({pos: s.name for pos, s in sessions.items()},
+                         {'1/1/1': 'A', '2/1/1': 'B', '1/2/1': 'C'})
+
+    def test_failed_split_configures_existing_panes_and_stops_the_rest(self):
+        log = []
+        # Splits below the first column are slow, so they are still pending
+        # when the root's second split fails
+        root = FakeSession(log, split_delay=0.01, fail_at=2, child_split_delay=0.05)
+        panes = [
+            {'position': '1/1', 'title': 'A'},
+            {'position': '2/1', 'title': 'B'},
+            {'position': '2/2', 'title': 'D'},
+            {'position': '1/2', 'title': 'C'},
+        ]
+
+        async def run():
+            try:
+                with self.assertRaises(RuntimeError):
+                    await ITermManager.render_tab_panes(FakeTab(root), panes, 'Default')
+                await asyncio.sleep(0.1)
+            finally:
+                await ITermManager.flush_pending()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            asyncio.run(run())
+            gc.collect()
+
+        self.assertEqual([str(w.message) for w in caught if issubclass(w.category, RuntimeWarning)], [])
+        self.assertEqual(root.name, 'A')
+        self.assertEqual(len(root.children), 1)
+        column = root.children[0]
+        self.assertEqual(column.name, 'B')
+        # The split of 2/2 was cancelled with the rest of the layout
+        self.assertEqual(column.children, [])
+        self.assertEqual(log, [('split', True)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for redacting configs before they are logged."""
+
+import os
+import tempfile
+import unittest
+
+from termis.config import config_loader
+from termis.config.config_loader import ConfigLoader
+
+
+class SanitizeConfigTest(unittest.TestCase):
+    """Redaction and copying rules of ConfigLoader.sanitize_config."""
+
+    def test_sensitive_keys_are_redacted_by_substring(self):
+        config = {
+            'profile': 'Work',
+            'run': {'env': {'DB_PASSWORD': 'hunter2', 'GITHUB_TOKEN': 'ghp', 'Api_Key': 'k', 'HOME': '/home'}},
+        }
+
+        sanitized = ConfigLoader.sanitize_config(config)
+
+        self.assertEqual(sanitized, {
+            'profile': 'Work',
+            'run': {'env': {'DB_PASSWORD': '***', 'GITHUB_TOKEN': '***', 'Api_Key': '***', 'HOME': '/home'}},
+        })
+        self.assertEqual(config['run']['env']['DB_PASSWORD'], 'hunter2')
+
+    def test_self_referencing_config_is_copied_once(self):
+        loop = [1]
+        loop.append(loop)
+        shared = {'secret': 's'}
+        config = {'a': loop, 'b': shared, 'c': shared}
+
+        sanitized = ConfigLoader.sanitize_config(config)
+
+        self.assertIs(sanitized['a'][1], sanitized['a'])
+        self.assertIsNot(sanitized['a'], loop)
+        self.assertIs(sanitized['b'], sanitized['c'])
+        self.assertEqual(sanitized['b'], {'secret': '***'})
+
+    def test_dry_run_of_aliased_config_terminates(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        config_loader._CONFIG_CACHE.clear()
+        self.addCleanup(config_loader._CONFIG_CACHE.clear)
+        config_path = os.path.join(tmp.name, 't.yml')
+        with open(config_path, 'w') as f:
+            f.write("a: &x [1, *x]\n")
+
+        with self.assertLogs('termis.config', level='INFO') as logs:
+            config = ConfigLoader.read_config(config_path, dry_run=True)
+
+        self.assertIs(config['a'][1], config['a'])
+        self.assertTrue(any('Config structure' in line for line in logs.output))
+
+
+if __name__ == '__main__':
+    unittest.main()